@@ -1,9 +1,14 @@
 """Tests for whisper_pandas package."""
+import copy
+import pickle
 import pytest
+import numpy as np
 import pandas as pd
 from numpy.testing import assert_allclose
 
+import whisper_pandas
 from whisper_pandas import WhisperFile, WhisperFileMeta, WhisperArchiveMeta
+from whisper_pandas import _drop_time_zero, _sort_by_time, _to_datetime_array
 
 
 @pytest.fixture(scope="session")
@@ -16,6 +21,17 @@ def meta(wsp) -> WhisperFileMeta:
     return wsp.meta
 
 
+@pytest.fixture(params=["numba", "numpy"])
+def decoder(request, monkeypatch) -> str:
+    """Decode points of archives of any size with numba or NumPy."""
+    if request.param == "numba":
+        pytest.importorskip("numba")
+        monkeypatch.setattr(whisper_pandas, "NUMBA_MIN_POINTS", 0)
+    else:
+        monkeypatch.setattr(whisper_pandas, "NUMBA_MIN_POINTS", 10**9)
+    return request.param
+
+
 def test_meta(meta):
     """Test if meta data is read OK."""
     assert meta.path == "data/example.wsp"
@@ -40,6 +56,14 @@ def test_meta(meta):
     )
 
 
+@pytest.mark.parametrize("path", ["data/example.wsp", "data/example.wsp.gz"])
+def test_meta_read(meta, path):
+    meta_read = WhisperFileMeta.read(path)
+    assert meta_read.path == path
+    assert meta_read.aggregation_method == meta.aggregation_method
+    assert meta_read.archives == meta.archives
+
+
 def test_data_archive_0(wsp):
     df = wsp.archives[0].to_frame()
     assert len(df) == 1555200
@@ -80,23 +104,206 @@ def test_data_archive_2(wsp):
 def test_archive_as_dataframe(wsp):
     df = wsp.archives[1].to_frame(to_datetime=False)
     assert df.shape == (2331015, 2)
-    assert df["timestamp"].dtype == "int32"
+    assert df["timestamp"].dtype == "uint32"
     assert df["value"].dtype == "float64"
 
 
+def test_to_datetime_array():
+    # Includes timestamps after 2038, which don't fit into int32
+    timestamp = np.array([1, 1626788340, 2**31, 2**32 - 1], dtype="uint32")
+    actual = pd.Series(_to_datetime_array(timestamp))
+    expected = pd.to_datetime(pd.Series(timestamp.astype("int64")), unit="s", utc=True)
+    pd.testing.assert_series_equal(actual, expected)
+
+
+@pytest.mark.parametrize(
+    "timestamp",
+    [
+        [1, 2, 3, 4],
+        [0, 0, 3, 4],
+        [1, 2, 0, 0],
+        [1, 0, 0, 4],
+        [0, 2, 3, 0],
+        [0, 2, 0, 4],
+        [1, 0, 3, 0],
+        [0, 0, 0, 0],
+        [0, 0, 3, 0],
+    ],
+)
+def test_drop_time_zero(timestamp):
+    timestamp = np.array(timestamp, dtype="uint32")
+    value = timestamp.astype("float64")
+    expected = timestamp[timestamp != 0]
+    timestamp, value = _drop_time_zero(timestamp, value)
+    assert list(timestamp) == list(expected)
+    assert list(value) == list(expected)
+
+
+@pytest.mark.parametrize(
+    "timestamp, index",
+    [
+        ([1, 2, 3, 4], [0, 1, 2, 3]),
+        ([3, 4, 1, 2], [2, 3, 0, 1]),
+        ([3, 1, 4, 2], [1, 3, 0, 2]),
+        ([2, 3, 1, 2], [2, 0, 3, 1]),
+    ],
+)
+def test_sort_by_time(timestamp, index):
+    timestamp = np.array(timestamp, dtype="uint32")
+    value = timestamp.astype("float64")
+    timestamp, value, index_actual = _sort_by_time(timestamp, value)
+    assert list(timestamp) == sorted(timestamp)
+    assert list(value) == sorted(value)
+    assert list(index_actual) == index
+
+
+@pytest.mark.parametrize("drop_time_zero", [True, False])
+@pytest.mark.parametrize("time_sort", [True, False])
+@pytest.mark.parametrize("dtype", ["float64", "float32"])
+def test_numba_decode_points(wsp, monkeypatch, drop_time_zero, time_sort, dtype):
+    pytest.importorskip("numba")
+    archive = wsp.archives[1]
+    kwargs = dict(drop_time_zero=drop_time_zero, time_sort=time_sort, dtype=dtype)
+    actual = archive.to_frame(**kwargs)
+    monkeypatch.setattr(whisper_pandas, "NUMBA_MIN_POINTS", archive.meta.points + 1)
+    expected = archive.to_frame(**kwargs)
+    pd.testing.assert_frame_equal(actual, expected, check_index_type=False)
+
+
+@pytest.mark.parametrize("time_sort", [True, False])
+@pytest.mark.parametrize("dtype", ["float64", "float32"])
+def test_to_frame_exact_size(wsp, decoder, time_sort, dtype):
+    archive = wsp.archives[1]
+    df = archive.to_frame(dtype=dtype, to_datetime=False, time_sort=time_sort)
+    for column in ["timestamp", "value"]:
+        array = df[column].values
+        base = array if array.base is None else array.base
+        assert base.nbytes == array.nbytes
+
+
+def test_archives_cached(wsp):
+    assert wsp.archives is wsp.archives
+    archive = wsp.archives[2]
+    assert archive._columns is archive._columns
+
+
+@pytest.mark.parametrize("path", ["data/example.wsp", "data/example.wsp.gz"])
+def test_pickle(path):
+    wsp = WhisperFile.read(path)
+    archive = wsp.archives[2]
+    actual = pickle.loads(pickle.dumps(archive))
+    pd.testing.assert_frame_equal(actual.to_frame(), archive.to_frame())
+    actual = pickle.loads(pickle.dumps(wsp))
+    pd.testing.assert_frame_equal(actual.archives[2].to_frame(), archive.to_frame())
+    wsp = WhisperFile.read(path, archives=[2])
+    actual = pickle.loads(pickle.dumps(wsp))
+    assert actual.archives[0] is None
+    pd.testing.assert_frame_equal(actual.archives[2].to_frame(), archive.to_frame())
+
+
+def test_equal(wsp):
+    assert WhisperFile.read("data/example.wsp") == wsp
+    assert WhisperFile.read("data/example.wsp", archives=[2]) == wsp
+    wsp_gz = WhisperFile.read("data/example.wsp.gz")
+    assert wsp_gz != wsp
+    assert wsp_gz.archives[2] == wsp.archives[2]
+
+
+def test_read_memmap(wsp):
+    assert isinstance(wsp.bytes, np.memmap)
+    assert len(wsp.bytes) == 82785664
+
+
+def test_describe_archives(meta):
+    df = meta.describe_archives()
+    assert df.shape == (3, 5)
+    assert df.index.name == "archive"
+    assert df.loc[1, "size"] == 63072000
+    assert df.loc[2, "retention"] == 315363600
+
+
+def pickle_clone(obj):
+    return pickle.loads(pickle.dumps(obj))
+
+
+@pytest.mark.parametrize("dtype", ["float64", "float32"])
+@pytest.mark.parametrize("clone", [None, pickle_clone, copy.deepcopy])
+def test_to_frame_owns_data(dtype, clone):
+    # Fresh file, so that its archive column cache isn't shared with other tests
+    archive = WhisperFile.read("data/example.wsp").archives[2]
+    kwargs = dict(dtype=dtype, to_datetime=False, drop_time_zero=False)
+    if clone is not None:
+        # Clone after the columns are cached, they must not be carried over
+        archive.to_frame(time_sort=False, **kwargs)
+        archive = clone(archive)
+        assert "_columns_cache" not in archive.__dict__
+    df = archive.to_frame(time_sort=False, **kwargs)
+    df.iloc[0, 1] = -1
+    assert archive.to_frame(time_sort=False, **kwargs).iloc[0, 1] != -1
+
+
 def test_print_info(wsp):
     wsp.print_info()
 
 
 def test_read_gzip():
     wsp = WhisperFile.read("data/example.wsp.gz")
-    assert type(wsp.bytes) is bytes
+    assert type(wsp.bytes) is bytearray
     assert len(wsp.bytes) == 82785664
     assert wsp.meta.file_size == 82785664
     assert wsp.meta.file_size_actual == 21696528
     wsp.print_info()
 
 
+@pytest.mark.parametrize("path", ["data/example.wsp", "data/example.wsp.gz"])
+def test_read_only_some_archives(wsp, path):
+    wsp_part = WhisperFile.read(path, archives=[-1, 2])
+    assert wsp_part.meta.archives == wsp.meta.archives
+    assert wsp_part.archives[0] is None
+    assert wsp_part.archives[1] is None
+    actual = wsp_part.archives[2].to_frame()
+    expected = wsp.archives[2].to_frame()
+    pd.testing.assert_frame_equal(actual, expected)
+
+
+def write_whisper_file(path, timestamp, value):
+    """Write a Whisper file with a single archive."""
+    meta = np.array([(1, 80, 0.5, 1)], dtype=whisper_pandas.DTYPE_FILE_META)
+    archive_meta = np.array(
+        [(28, 10, len(timestamp))], dtype=whisper_pandas.DTYPE_ARCHIVE_META
+    )
+    points = np.empty(len(timestamp), dtype=whisper_pandas.DTYPE_POINT)
+    points["timestamp"] = timestamp
+    points["value"] = value
+    path.write_bytes(meta.tobytes() + archive_meta.tobytes() + points.tobytes())
+
+
+def test_ring_buffer_rotation(tmp_path, decoder):
+    path = tmp_path / "ring.wsp"
+    timestamp = [70, 80, 0, 0, 30, 40, 50, 60]
+    write_whisper_file(path, timestamp, [7, 8, 0, 0, 3, 4, 5, 6])
+
+    df = WhisperFile.read(path).archives[0].to_frame(to_datetime=False)
+    assert list(df["timestamp"]) == [30, 40, 50, 60, 70, 80]
+    assert list(df["value"]) == [3, 4, 5, 6, 7, 8]
+    assert list(df.index) == [2, 3, 4, 5, 0, 1]
+
+    df = WhisperFile.read(path).archives[0].to_frame(
+        to_datetime=False, time_sort=False
+    )
+    assert list(df["timestamp"]) == [70, 80, 30, 40, 50, 60]
+
+
+def test_to_frames():
+    wsp = WhisperFile.read("data/example.wsp", archives=[0, 2])
+    dfs = wsp.to_frames(dtype="float32")
+    assert len(dfs) == 3
+    assert dfs[1] is None
+    for idx in [0, 2]:
+        expected = wsp.archives[idx].to_frame(dtype="float32")
+        pd.testing.assert_frame_equal(dfs[idx], expected)
+
+
 def test_truncated():
     wsp = WhisperFile.read("data/example_truncated.wsp")
     assert wsp.meta.file_size == 82785664
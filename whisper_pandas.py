@@ -2,9 +2,13 @@
 """WhisperDB Python Pandas Reader."""
 from __future__ import annotations
 import dataclasses
+import functools
 import argparse
+import os
+import struct
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Tuple
 import numpy as np
 import pandas as pd
 
@@ -30,6 +34,18 @@ DTYPE_ARCHIVE_META = np.dtype(
 )
 DTYPE_POINT = np.dtype([("timestamp", ">u4"), ("value", ">f8")])
 
+# The same formats for the header, for parsing with the struct module,
+# which is much faster than np.frombuffer for single records
+STRUCT_FILE_META = struct.Struct(">IIfI")
+STRUCT_ARCHIVE_META = struct.Struct(">III")
+
+DTYPE_DATETIME_UTC = pd.DatetimeTZDtype(tz="UTC")
+
+# Element sizes in bytes, as plain ints to avoid dtype attribute lookups
+_FILE_META_SIZE = DTYPE_FILE_META.itemsize
+_ARCHIVE_META_SIZE = DTYPE_ARCHIVE_META.itemsize
+_POINT_SIZE = DTYPE_POINT.itemsize
+
 AGGREGATION_TYPE_TO_METHOD = {
     1: "average",
     2: "sum",
@@ -41,11 +57,20 @@ AGGREGATION_TYPE_TO_METHOD = {
     8: "absmin",
 }
 
+# Chunk size for streaming gzip decompression
+GZIP_READ_SIZE = 128 * 1024
+
+# Minimum archive size to use the numba point decoder (if numba is installed)
+NUMBA_MIN_POINTS = 100_000
+
 
 @dataclasses.dataclass
 class WhisperArchiveMeta:
     """Whisper archive metadata."""
 
+    # No per-instance __dict__, there is one of these per archive and file
+    __slots__ = ("index", "offset", "seconds_per_point", "points")
+
     index: int
     offset: int
     seconds_per_point: int
@@ -53,15 +78,15 @@ class WhisperArchiveMeta:
 
     @classmethod
     def from_buffer(cls, buffer, index: int) -> WhisperArchiveMeta:
-        offset = DTYPE_FILE_META.itemsize + index * DTYPE_ARCHIVE_META.itemsize
-        meta = np.frombuffer(buffer, dtype=DTYPE_ARCHIVE_META, count=1, offset=offset)[
-            0
-        ]
+        offset = _FILE_META_SIZE + index * _ARCHIVE_META_SIZE
+        offset, seconds_per_point, points = STRUCT_ARCHIVE_META.unpack_from(
+            buffer, offset
+        )
         return cls(
             index=index,
-            offset=int(meta["offset"]),
-            seconds_per_point=int(meta["seconds_per_point"]),
-            points=int(meta["points"]),
+            offset=offset,
+            seconds_per_point=seconds_per_point,
+            points=points,
         )
 
     @property
@@ -70,7 +95,7 @@ class WhisperArchiveMeta:
 
     @property
     def size(self) -> int:
-        return DTYPE_POINT.itemsize * self.points
+        return _POINT_SIZE * self.points
 
     def describe(self) -> pd.DataFrame:
         return pd.Series(
@@ -96,23 +121,40 @@ class WhisperFileMeta:
     archives: List[WhisperArchiveMeta]
 
     @staticmethod
-    def _meta_from_buffer(buffer: bytes) -> dict:
-        meta = np.frombuffer(buffer, dtype=DTYPE_FILE_META, count=1)[0]
-        aggregation_method = AGGREGATION_TYPE_TO_METHOD[int(meta["aggregation_type"])]
+    def _meta_from_buffer(buffer: bytes | np.ndarray) -> dict:
+        (
+            aggregation_type,
+            max_retention,
+            x_files_factor,
+            archive_count,
+        ) = STRUCT_FILE_META.unpack_from(buffer)
         return {
-            "aggregation_method": aggregation_method,
-            "max_retention": int(meta["max_retention"]),
-            "x_files_factor": float(meta["x_files_factor"]),
-            "archive_count": int(meta["archive_count"]),
+            "aggregation_method": AGGREGATION_TYPE_TO_METHOD[aggregation_type],
+            "max_retention": max_retention,
+            "x_files_factor": x_files_factor,
+            "archive_count": archive_count,
         }
 
     @classmethod
-    def from_buffer(cls, buffer: bytes, path: str | Path) -> WhisperFileMeta:
-        file_meta = cls._meta_from_buffer(buffer[0 : DTYPE_FILE_META.itemsize])
-        archives = []
-        for idx in range(file_meta["archive_count"]):
-            archive_meta = WhisperArchiveMeta.from_buffer(buffer, idx)
-            archives.append(archive_meta)
+    def from_buffer(
+        cls, buffer: bytes | np.ndarray, path: str | Path
+    ) -> WhisperFileMeta:
+        file_meta = cls._meta_from_buffer(buffer[0:_FILE_META_SIZE])
+        archive_metas = np.frombuffer(
+            buffer,
+            dtype=DTYPE_ARCHIVE_META,
+            count=file_meta["archive_count"],
+            offset=_FILE_META_SIZE,
+        ).tolist()
+        archives = [
+            WhisperArchiveMeta(
+                index=idx,
+                offset=offset,
+                seconds_per_point=seconds_per_point,
+                points=points,
+            )
+            for idx, (offset, seconds_per_point, points) in enumerate(archive_metas)
+        ]
 
         return cls(
             path=str(path),
@@ -122,21 +164,49 @@ class WhisperFileMeta:
             archives=archives,
         )
 
+    @classmethod
+    def read(cls, path: str | Path, compression: str = "infer") -> WhisperFileMeta:
+        """Read Whisper file metadata.
+
+        Only the file header is read, not the archive data.
+
+        Parameters
+        ----------
+        path : str | Path
+            Filename
+        compression : {"infer", "none", "gzip"}
+            For on-the-fly decompression
+        """
+        path = Path(path)
+        compression = _infer_compression(path, compression)
+
+        if compression == "none":
+            # Unbuffered, so that exactly the header bytes are read
+            with path.open("rb", buffering=0) as fh:
+                header = _read_header(fh)
+        elif compression == "gzip":
+            import gzip
+
+            with gzip.open(path, "rb") as fh:
+                header = _read_header(fh)
+        else:
+            raise ValueError(f"Invalid compression: {compression!r}")
+
+        return cls.from_buffer(header, path=path)
+
     @property
     def header_size(self) -> int:
         """Whisper file header size in bytes"""
-        return DTYPE_FILE_META.itemsize + DTYPE_ARCHIVE_META.itemsize * len(
-            self.archives
-        )
+        return _FILE_META_SIZE + _ARCHIVE_META_SIZE * len(self.archives)
 
     @property
     def file_size(self) -> int:
         """Whisper file total size in bytes"""
         return self.header_size + sum(archive.size for archive in self.archives)
 
-    @property
+    @functools.cached_property
     def file_size_actual(self) -> int:
-        """Actual file size in bytes"""
+        """Actual file size in bytes (cached after the first access)"""
         return Path(self.path).stat().st_size
 
     @property
@@ -158,9 +228,21 @@ class WhisperFileMeta:
 
     def describe_archives(self) -> pd.DataFrame:
         """Archive summary information table."""
-        infos = [_.describe()["value"] for _ in self.archives]
-        df = pd.DataFrame(infos).set_index("archive")
-        return df
+        columns = {
+            "seconds_per_point": [],
+            "points": [],
+            "retention": [],
+            "offset": [],
+            "size": [],
+        }
+        for archive in self.archives:
+            columns["seconds_per_point"].append(archive.seconds_per_point)
+            columns["points"].append(archive.points)
+            columns["retention"].append(archive.retention)
+            columns["offset"].append(archive.offset)
+            columns["size"].append(archive.size)
+        index = pd.Index([_.index for _ in self.archives], name="archive")
+        return pd.DataFrame(columns, index=index)
 
     def print_info(self):
         print(self.describe_meta())
@@ -168,20 +250,235 @@ class WhisperFileMeta:
         print(self.describe_archives())
 
 
+def _to_datetime_array(timestamp: np.ndarray) -> pd.arrays.DatetimeArray:
+    """Convert Unix timestamps in seconds to a UTC datetime array.
+
+    Building the array from nanoseconds directly is much faster
+    than pd.to_datetime(timestamp, unit="s", utc=True).
+    The private DatetimeArray._simple_new wraps the nanoseconds without
+    validation or copy, pd.DatetimeIndex(..., tz="UTC") would copy them.
+    """
+    ns = timestamp.astype(np.int64)
+    ns *= 1_000_000_000
+    return pd.arrays.DatetimeArray._simple_new(
+        ns.view("datetime64[ns]"), dtype=DTYPE_DATETIME_UTC
+    )
+
+
+def _drop_time_zero(
+    timestamp: np.ndarray, value: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray]:
+    """Drop points where time is 0, i.e. that were never filled.
+
+    Unfilled points usually form one contiguous block in the ring buffer,
+    so the remaining points can be taken with slices. That is checked on the
+    boolean mask alone, without computing index arrays. Scattered zeros fall
+    back to gathering the non-zero positions, which is faster than
+    boolean mask indexing since the positions are computed once for both arrays.
+    """
+    zero = timestamp == 0
+    count = np.count_nonzero(zero)
+    if count == 0:
+        return timestamp, value
+
+    # Points that are kept form one run (zeros at the start, end or both ends)
+    start = zero.argmin()
+    stop = start + len(timestamp) - count
+    if not zero[start:stop].any():
+        return timestamp[start:stop], value[start:stop]
+
+    # Zeros form one block in the middle
+    start = zero.argmax()
+    stop = start + count
+    if zero[start:stop].all():
+        return (
+            np.concatenate((timestamp[:start], timestamp[stop:])),
+            np.concatenate((value[:start], value[stop:])),
+        )
+
+    keep = np.flatnonzero(timestamp)
+    return timestamp[keep], value[keep]
+
+
+def _rotate(
+    timestamp: np.ndarray, value: np.ndarray, k: int
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+    """Rotate points so that position ``k`` comes first.
+
+    Returns rotated timestamps, values and the positions of the points before.
+    """
+    timestamp = np.concatenate((timestamp[k:], timestamp[:k]))
+    value = np.concatenate((value[k:], value[:k]))
+    index = np.concatenate((np.arange(k, len(value)), np.arange(k)))
+    return timestamp, value, index
+
+
+def _sort_by_time(
+    timestamp: np.ndarray, value: np.ndarray
+) -> Tuple[np.ndarray, np.ndarray, np.ndarray | pd.RangeIndex]:
+    """Sort points in chronological order.
+
+    Whisper archives are ring buffers, so usually the points consist of
+    two sorted runs and can be put in order by a rotation, which is O(N).
+    Otherwise (e.g. stale points left over from gaps) a stable argsort is used.
+
+    Returns sorted timestamps, values and the positions of the points before sorting.
+    """
+    size = len(timestamp)
+    descents = np.flatnonzero(timestamp[1:] < timestamp[:-1])
+
+    if len(descents) == 0:
+        return timestamp, value, pd.RangeIndex(size)
+
+    if len(descents) == 1 and timestamp[-1] < timestamp[0]:
+        return _rotate(timestamp, value, descents[0] + 1)
+
+    # Stale points split the ring buffer into a few sorted runs. The stable
+    # sort (timsort) detects and merges such runs, so this is still close to O(N).
+    order = np.argsort(timestamp, kind="stable")
+    return timestamp[order], value[order], order
+
+
+@functools.lru_cache(maxsize=None)
+def _numba_decode_points():
+    """Compile the fused numba point decoder, or return None if numba isn't installed.
+
+    The decoder takes the raw archive bytes as a ``(points, 12)`` uint8 array and
+    in a single pass byte-swaps the points, drops time zero points and counts
+    the descents in time. Values are written to the given float64 or float32
+    array, so float32 output needs no separate cast. It returns timestamps,
+    the number of points kept, the number of descents and the position ``k``
+    of the last descent, which is where the ring buffer has to be rotated
+    if there's only one.
+    """
+    try:
+        import numba
+    except ImportError:
+        return None
+
+    @numba.njit(cache=True, boundscheck=False, nogil=True)
+    def decode(raw, drop_time_zero, value):
+        size = raw.shape[0]
+        timestamp = np.empty(size, np.uint32)
+        # To reinterpret the big-endian value bits as float64
+        bits = np.empty(1, np.int64)
+        bits_value = bits.view(np.float64)
+
+        j = 0
+        descents = 0
+        k = 0
+        previous = 0
+        for i in range(size):
+            t = (
+                (np.int64(raw[i, 0]) << 24)
+                | (np.int64(raw[i, 1]) << 16)
+                | (np.int64(raw[i, 2]) << 8)
+                | np.int64(raw[i, 3])
+            )
+            if drop_time_zero and t == 0:
+                continue
+            if j > 0 and t < previous:
+                descents += 1
+                k = j
+            previous = t
+            timestamp[j] = t
+            b = np.int64(0)
+            for c in range(4, 12):
+                b = (b << 8) | np.int64(raw[i, c])
+            bits[0] = b
+            value[j] = bits_value[0]
+            j += 1
+
+        return timestamp[:j], j, descents, k
+
+    return decode
+
+
+@functools.lru_cache(maxsize=None)
+def _thread_pool() -> ThreadPoolExecutor:
+    """Thread pool shared by all files for converting archives, created on first use."""
+    return ThreadPoolExecutor(max_workers=min(8, os.cpu_count() or 1))
+
+
 @dataclasses.dataclass
 class WhisperArchive:
     """Whisper file single archive."""
 
     meta: WhisperArchiveMeta
-    bytes: bytes = dataclasses.field(repr=False)
+    # Zero-copy view of the archive points in the file buffer
+    bytes: np.ndarray = dataclasses.field(repr=False, compare=False)
 
     def to_numpy(self) -> np.ndarray:
-        return np.frombuffer(
-            self.bytes,
-            dtype=DTYPE_POINT,
-            count=self.meta.points,
-            offset=self.meta.offset,
-        )
+        return np.frombuffer(self.bytes, dtype=DTYPE_POINT, count=self.meta.points)
+
+    def __getstate__(self) -> dict:
+        # The cached columns are derived data, leave them out of pickles and copies
+        state = self.__dict__.copy()
+        state.pop("_columns_cache", None)
+        return state
+
+    @property
+    def _columns(self) -> Tuple[np.ndarray, np.ndarray]:
+        """Timestamp and value columns in native byte order (cached, read-only).
+
+        Cached without the class-wide lock of ``functools.cached_property``.
+        """
+        columns = self.__dict__.get("_columns_cache")
+        if columns is not None:
+            return columns
+
+        data = self.to_numpy()
+        timestamp = data["timestamp"].astype(np.uint32)
+        value = data["value"].astype(np.float64)
+        timestamp.flags.writeable = False
+        value.flags.writeable = False
+        self._columns_cache = timestamp, value
+        return timestamp, value
+
+    def _to_sorted_columns(
+        self, drop_time_zero: bool, time_sort: bool, dtype: str = "float64"
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray | pd.RangeIndex | None]:
+        """Timestamp and value columns with time zero points dropped and sorted.
+
+        Also returns the index for the points, which is None if unsorted.
+        The values are float64, or ``dtype`` if the numba decoder could
+        produce it directly.
+        """
+        decode = None
+        if self.meta.points >= NUMBA_MIN_POINTS:
+            decode = _numba_decode_points()
+
+        if decode is not None:
+            raw = np.frombuffer(
+                self.bytes, dtype=np.uint8, count=self.meta.size
+            ).reshape(self.meta.points, _POINT_SIZE)
+            if np.dtype(dtype) not in (np.float64, np.float32):
+                dtype = "float64"
+            value = np.empty(self.meta.points, dtype=dtype)
+            timestamp, size, descents, k = decode(raw, drop_time_zero, value)
+            value = value[:size]
+            if not time_sort or descents == 0:
+                # The arrays are allocated for all points and the DataFrame
+                # is built without a copy, so copy to the exact size to not
+                # keep the unused rest alive.
+                if size < self.meta.points:
+                    timestamp = timestamp.copy()
+                    value = value.copy()
+                index = pd.RangeIndex(size) if time_sort else None
+                return timestamp, value, index
+            if descents == 1 and timestamp[-1] < timestamp[0]:
+                return _rotate(timestamp, value, k)
+            return _sort_by_time(timestamp, value)
+
+        timestamp, value = self._columns
+
+        if drop_time_zero:
+            timestamp, value = _drop_time_zero(timestamp, value)
+
+        if not time_sort:
+            return timestamp, value, None
+
+        return _sort_by_time(timestamp, value)
 
     def to_frame(
         self,
@@ -201,7 +498,8 @@ class WhisperArchive:
         drop_time_zero : bool
             Drop points where time is 0, i.e. that were never filled?
         time_sort : bool
-            Sort points in chronological order?
+            Sort points in chronological order? If False, no sort is done
+            and points are in the circular-buffer order of the archive.
 
         Returns
         -------
@@ -209,29 +507,99 @@ class WhisperArchive:
             Dataframe with columns "timestamp" and "value" and the
             point position index in the Whisper archive as index.
         """
-        data = self.to_numpy()
-
-        if drop_time_zero:
-            data = data[data["timestamp"] != 0]
+        timestamp, value, index = self._to_sorted_columns(
+            drop_time_zero, time_sort, dtype
+        )
 
-        # The int32 typecast is a workaround for a performance bug
-        # on pandas versions < 1.3 when using uint32
-        # https://github.com/pandas-dev/pandas/issues/42606
-        # int32 max value can represent times up to year 2038
-        timestamp = data["timestamp"].astype("int32")
         if to_datetime:
-            timestamp = pd.to_datetime(timestamp, unit="s", utc=True)
-
-        # The type cast for the values is needed to avoid this error later on
-        # ValueError: Big-endian buffer not supported on little-endian compiler
-        value = data["value"].astype(dtype)
+            timestamp = _to_datetime_array(timestamp)
+
+        value = value.astype(dtype, copy=False)
+
+        # The DataFrame is built without copying the columns, so the cached
+        # columns (which are passed through unchanged, or sliced, if there
+        # is nothing to drop or sort) are copied here.
+        cached = self.__dict__.get("_columns_cache")
+        if cached is not None:
+            if isinstance(timestamp, np.ndarray) and np.may_share_memory(
+                timestamp, cached[0]
+            ):
+                timestamp = timestamp.copy()
+            if np.may_share_memory(value, cached[1]):
+                value = value.copy()
+
+        return pd.DataFrame(
+            {"timestamp": timestamp, "value": value}, index=index, copy=False
+        )
 
-        df = pd.DataFrame({"timestamp": timestamp, "value": value})
 
-        if time_sort:
-            df = df.sort_values("timestamp")
+def _infer_compression(path: Path, compression: str) -> str:
+    """Infer compression from the file extension if ``compression="infer"``."""
+    if compression == "infer":
+        if path.suffix == ".gz":
+            return "gzip"
+        return "none"
+    return compression
+
+
+def _read_header(fh) -> bytes:
+    """Read the header (file metadata and archive table) from an open file."""
+    header = fh.read(_FILE_META_SIZE)
+    archive_count = WhisperFileMeta._meta_from_buffer(header)["archive_count"]
+    return header + fh.read(archive_count * _ARCHIVE_META_SIZE)
+
+
+def _open_gzip(path: Path, parallelization: int = 0):
+    """Open gzip file for reading.
+
+    Uses ``rapidgzip`` for parallel decompression if it is installed,
+    otherwise ``isal`` (Intel ISA-L inflate) if it is installed,
+    otherwise falls back to the ``gzip`` module from the standard library.
+    """
+    try:
+        import rapidgzip
+    except ImportError:
+        pass
+    else:
+        return rapidgzip.open(str(path), parallelization=parallelization)
+
+    try:
+        from isal import igzip
+    except ImportError:
+        import gzip
+
+        return gzip.open(path, "rb")
+
+    return igzip.open(path, "rb")
+
+
+def _read_gzip(path: Path, parallelization: int = 0) -> bytearray:
+    """Decompress gzip file into a preallocated buffer.
+
+    The buffer size is taken from the gzip trailer, which stores the
+    uncompressed size modulo 2**32. If that turns out to be wrong
+    (files larger than 4 GB or multi-member files), the buffer is resized.
+    """
+    with path.open("rb") as fh:
+        fh.seek(-4, 2)
+        (size,) = struct.unpack("<I", fh.read(4))
+
+    buffer = bytearray(size)
+    view = memoryview(buffer)
+    n = 0
+    with _open_gzip(path, parallelization) as fh:
+        while n < size:
+            count = fh.readinto(view[n : n + GZIP_READ_SIZE])
+            if count == 0:
+                break
+            n += count
+        view.release()
+        if n < size:
+            del buffer[n:]
+        else:
+            buffer += fh.read()
 
-        return df
+    return buffer
 
 
 @dataclasses.dataclass
@@ -239,10 +607,23 @@ class WhisperFile:
     """Whisper file (metadata and all archives)."""
 
     meta: WhisperFileMeta
-    bytes: bytes = dataclasses.field(repr=False)
+    # File buffer (memory-mapped for uncompressed files).
+    # Buffers are not compared, ``==`` on arrays doesn't give a single bool.
+    bytes: bytes | bytearray | np.ndarray = dataclasses.field(repr=False, compare=False)
+    # Views of the archives that were read, None if all archives were read.
+    # Array slices rather than memoryview slices, which can't be pickled.
+    archive_buffers: Dict[int, np.ndarray] | None = dataclasses.field(
+        default=None, repr=False, compare=False
+    )
 
     @classmethod
-    def read(cls, path: str | Path, compression: str = "infer") -> WhisperFile:
+    def read(
+        cls,
+        path: str | Path,
+        compression: str = "infer",
+        parallelization: int = 0,
+        archives: List[int] | None = None,
+    ) -> WhisperFile:
         """Read Whisper file.
 
         Parameters
@@ -251,35 +632,87 @@ class WhisperFile:
             Filename
         compression : {"infer", "none", "gzip"}
             For on-the-fly decompression
+        parallelization : int
+            Number of threads for gzip decompression with ``rapidgzip``,
+            0 means use all cores. Ignored if ``rapidgzip`` is not installed.
+        archives : list of int, optional
+            Indices of the archives to read, default is all archives.
+            Archives that aren't read are None in ``archives``.
         """
         path = Path(path)
 
-        if compression == "infer":
-            if path.suffix == ".gz":
-                compression = "gzip"
-            else:
-                compression = "none"
+        compression = _infer_compression(path, compression)
 
         if compression == "none":
-            buffer = path.read_bytes()
+            # Memory-map instead of reading the whole file, so that only the
+            # pages of the archives that are actually accessed get loaded.
+            buffer = np.memmap(path, dtype=np.uint8, mode="r")
         elif compression == "gzip":
-            import gzip
-
-            buffer = path.read_bytes()
-            buffer = gzip.decompress(buffer)
+            buffer = _read_gzip(path, parallelization)
         else:
             raise ValueError(f"Invalid compression: {compression!r}")
 
         meta = WhisperFileMeta.from_buffer(buffer, path=path)
 
-        return cls(meta=meta, bytes=buffer)
+        archive_buffers = None
+        if archives is not None:
+            view = np.frombuffer(buffer, dtype=np.uint8)
+            archive_buffers = {}
+            for idx in frozenset(archives):
+                # Keyed by archive.index, so that negative indices work
+                archive = meta.archives[idx]
+                start = archive.offset
+                archive_buffers[archive.index] = view[start : start + archive.size]
+
+        return cls(meta=meta, bytes=buffer, archive_buffers=archive_buffers)
+
+    @functools.cached_property
+    def archives(self) -> List[WhisperArchive | None]:
+        """Whisper file archive list.
+
+        The archives only hold views of their own points in the file buffer,
+        and DataFrames returned by ``WhisperArchive.to_frame`` own their data,
+        so the buffer is released once the ``WhisperFile`` and its archives
+        are no longer used.
+        """
+        if self.archive_buffers is None:
+            view = np.frombuffer(self.bytes, dtype=np.uint8)
+            buffers = {
+                meta.index: view[meta.offset : meta.offset + meta.size]
+                for meta in self.meta.archives
+            }
+        else:
+            buffers = self.archive_buffers
 
-    @property
-    def archives(self) -> List[WhisperArchive]:
-        """Whisper file archive list."""
-        return [
-            WhisperArchive(meta=meta, bytes=self.bytes) for meta in self.meta.archives
-        ]
+        archives = []
+        for meta in self.meta.archives:
+            if meta.index in buffers:
+                archives.append(WhisperArchive(meta=meta, bytes=buffers[meta.index]))
+            else:
+                archives.append(None)
+        return archives
+
+    def to_frames(self, **kwargs) -> List[pd.DataFrame | None]:
+        """Convert all archives to pandas.DataFrame, in parallel threads.
+
+        The archives are independent and most of the conversion runs in
+        NumPy (or numba) code that releases the GIL.
+
+        Parameters
+        ----------
+        **kwargs
+            Passed on to `WhisperArchive.to_frame`
+
+        Returns
+        -------
+        dfs : list of pandas.DataFrame
+            One per archive, None for archives that weren't read.
+        """
+
+        def to_frame(archive):
+            return None if archive is None else archive.to_frame(**kwargs)
+
+        return list(_thread_pool().map(to_frame, self.archives))
 
     def print_info(self):
         self.meta.print_info()
@@ -291,8 +724,8 @@ def main():
     parser.add_argument("path")
     args = parser.parse_args()
 
-    wsp = WhisperFile.read(args.path)
-    wsp.meta.print_info()
+    meta = WhisperFileMeta.read(args.path)
+    meta.print_info()
 
 
 if __name__ == "__main__":